@@ -1,10 +1,17 @@
 # 🚀 Complete Professional Quality Thought AI Mentor
 import os
-import subprocess
+import math
+import uuid
+import asyncio
+import threading
+import time
+import io
+import cProfile
+import pstats
+from contextlib import contextmanager, nullcontext
 import streamlit as st
-from langchain_community.chat_models import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
 from datetime import datetime
+import mentor_core as core
 
 # ✅ Professional Page Configuration
 st.set_page_config(
@@ -14,6 +21,136 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# ✅ Rerun Profiling Mode (?profile=1 or AIMENTOR_PROFILE=1; AIMENTOR_PROFILE=full adds cProfile)
+# cProfile slows down the whole process, so it is only available to whoever sets the environment
+profile_env = os.getenv("AIMENTOR_PROFILE", "").lower()
+profiling_enabled = (str(st.query_params.get("profile", "")).lower() in ("1", "true")
+                     or profile_env in ("1", "true", "full"))
+full_profiling = profile_env == "full"
+
+
+@st.cache_resource
+def get_profile_store():
+    # Aggregated across reruns and sessions of this server process
+    return {
+        'sections': {},
+        'reruns': 0,
+        'sessions': 0,
+        'stats': None,
+        'profiled_reruns': 0,
+        'active_profiler': None,
+        'lock': threading.Lock()
+    }
+
+
+def _record_section(name, elapsed):
+    rerun_timings[name] = rerun_timings.get(name, 0.0) + elapsed
+    store = get_profile_store()
+    with store['lock']:
+        section = store['sections'].setdefault(name, {'count': 0, 'total': 0.0, 'max': 0.0})
+        section['count'] += 1
+        section['total'] += elapsed
+        section['max'] = max(section['max'], elapsed)
+
+
+def _profile_checkpoint(name):
+    # Times the stretch of the script since the previous checkpoint
+    global last_checkpoint
+    now = time.perf_counter()
+    _record_section(name, now - last_checkpoint)
+    last_checkpoint = now
+
+
+@contextmanager
+def _profile_section(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record_section(name, time.perf_counter() - start)
+
+
+def _take_active_profiler(profiler=None):
+    # Hands back the stored profiler (only if it is `profiler`, when given) and clears the slot
+    store = get_profile_store()
+    with store['lock']:
+        active = store['active_profiler']
+        if active is None or (profiler is not None and active is not profiler):
+            return None
+        store['active_profiler'] = None
+        return active
+
+
+def _merge_profiler(profiler):
+    profiler.disable()
+    store = get_profile_store()
+    with store['lock']:
+        if store['stats'] is None:
+            store['stats'] = pstats.Stats(profiler)
+        else:
+            store['stats'].add(profiler)
+        store['profiled_reruns'] += 1
+
+
+def profile_report():
+    store = get_profile_store()
+    with store['lock']:
+        lines = [
+            "# Quality Thought AI Mentor - Rerun Profile",
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Reruns: {store['reruns']} | Sessions: {store['sessions']} | cProfiled reruns: {store['profiled_reruns']}",
+            "",
+            "llm_call is timed on its own and also counted in the section that made the call.",
+            "",
+            f"{'Section':<20}{'Count':>8}{'Total ms':>12}{'Mean ms':>10}{'Max ms':>10}"
+        ]
+        for name, section in sorted(store['sections'].items(), key=lambda item: -item[1]['total']):
+            lines.append(
+                f"{name:<20}{section['count']:>8}{section['total'] * 1000:>12.1f}"
+                f"{section['total'] * 1000 / section['count']:>10.1f}{section['max'] * 1000:>10.1f}"
+            )
+        if store['stats'] is not None:
+            stream = io.StringIO()
+            store['stats'].stream = stream
+            store['stats'].sort_stats("cumulative").print_stats(40)
+            lines += ["", "## cProfile (top 40 by cumulative time)", stream.getvalue()]
+    return "\n".join(lines)
+
+
+# A rerun cut short by st.rerun(), an exception or a closed session never reaches the end
+# of the script, so its profiler is switched off and merged by the next rerun of any session
+leftover_profiler = _take_active_profiler()
+if leftover_profiler is not None:
+    _merge_profiler(leftover_profiler)
+
+if profiling_enabled:
+    rerun_timings = {}
+    rerun_start = last_checkpoint = time.perf_counter()
+    profile_checkpoint = _profile_checkpoint
+    profile_section = _profile_section
+    # Counted up front so reruns that end early are included
+    profile_store = get_profile_store()
+    with profile_store['lock']:
+        profile_store['reruns'] += 1
+        if 'profile_session_counted' not in st.session_state:
+            st.session_state.profile_session_counted = True
+            profile_store['sessions'] += 1
+    rerun_profiler = None
+    if full_profiling:
+        rerun_profiler = cProfile.Profile()
+        try:
+            rerun_profiler.enable()
+            with profile_store['lock']:
+                profile_store['active_profiler'] = rerun_profiler
+        except ValueError:
+            # Another profiler holds the hook; on Python 3.12+ it is process-wide,
+            # so concurrent full-mode sessions take turns and this rerun only gets section timings
+            pass
+else:
+    # Disabled: checkpoints are no-ops and sections are a shared null context
+    profile_checkpoint = lambda name: None
+    profile_section = lambda name: nullcontext()
+
 # ✅ Load API Key (Your setup - will work when you add the key)
 openrouter_api_key = st.secrets.get("OPENROUTER_API_KEY", None)
 if not openrouter_api_key:
@@ -25,16 +162,40 @@ if not openrouter_api_key:
         pass
 
 # ✅ Initialize Model (will work when API key is added)
-if openrouter_api_key:
-    model = ChatOpenAI(
-        model_name="mistralai/mistral-7b-instruct:free",
-        temperature=0.5,
-        max_tokens=500,
-        openai_api_key=openrouter_api_key,
-        base_url="https://openrouter.ai/api/v1"
-    )
-else:
-    model = None
+@st.cache_resource
+def get_model(api_key):
+    # One client per key for the whole process, always used from the core loop
+    return core.create_model(api_key)
+
+
+model = get_model(openrouter_api_key) if openrouter_api_key else None
+
+# ✅ Multilingual Answer Options (the answer and translation caches live in mentor_core)
+interface_languages = core.INTERFACE_LANGUAGES
+
+# Languages a cohort is taught in; translations for these are prefetched in the background
+cohort_languages_setting = st.secrets.get("COHORT_LANGUAGES", None) or os.getenv("COHORT_LANGUAGES", "")
+if isinstance(cohort_languages_setting, str):
+    cohort_languages_setting = cohort_languages_setting.split(",")
+cohort_languages = [l.strip() for l in cohort_languages_setting
+                    if l.strip() in interface_languages and l.strip() != core.CANONICAL_LANG]
+
+
+# Seconds learner code may run before it is killed
+RUN_CODE_TIMEOUT = 10
+
+
+def run_core(coro, section="llm_call"):
+    # Core calls share one long-lived loop so the model client and prefetch tasks outlive the rerun
+    with profile_section(section):
+        return core.run_sync(coro)
+
+
+def answer_options():
+    return {'derive_translations': derive_translations, 'prefetch_languages': cohort_languages}
+
+
+profile_checkpoint("setup")
 
 # ✅ Professional Theme System
 with st.sidebar:
@@ -45,6 +206,15 @@ with st.sidebar:
         index=0
     )
 
+    st.markdown("### 🌍 Answer Languages")
+    derive_translations = st.checkbox(
+        "Translate from English answer (faster)",
+        value=False,
+        help="Generate each answer once in English and translate it into other languages. Translations are cached."
+    )
+
+profile_checkpoint("sidebar_theme")
+
 # ✅ Theme Configurations
 themes = {
     "Corporate Blue": {
@@ -192,6 +362,8 @@ st.markdown(f"""
     </div>
 """, unsafe_allow_html=True)
 
+profile_checkpoint("css")
+
 # ✅ Organized Module System
 programming_languages = [
     ("Python", "🐍"), ("Java", "☕"), ("C++", "💻"), ("JavaScript", "🔨"),
@@ -250,12 +422,35 @@ all_modules = (programming_languages + web_development + data_science +
 if 'mentor_type' not in st.session_state:
     st.session_state.mentor_type = None
     st.session_state.code_input = ""
-    st.session_state.user_progress = {}
-    st.session_state.chat_history = []
-    st.session_state.bookmarks = []
-    st.session_state.user_notes = {}
-    st.session_state.session_start = datetime.now()
-    st.session_state.total_queries = 0
+    st.session_state.open_items = set()
+    for key, value in core.new_session_state().items():
+        st.session_state[key] = value
+
+
+# ✅ Learner Identity (saved files stay reachable across refreshes and new sessions)
+def resolve_user_id():
+    # 1. Streamlit login, when auth is configured
+    user = getattr(st, "user", None)
+    try:
+        if user is not None and user.is_logged_in:
+            return f"login:{user.email}"
+    except (AttributeError, KeyError):
+        pass
+    # 2. A fixed ID for single-learner deployments
+    configured_id = st.secrets.get("AIMENTOR_USER_ID", None) or os.getenv("AIMENTOR_USER_ID")
+    if configured_id:
+        return f"config:{configured_id}"
+    # 3. A random workspace token kept in the URL, so a refresh or a bookmarked link finds the same files
+    token = st.query_params.get("workspace")
+    if not token:
+        token = uuid.uuid4().hex
+        st.query_params["workspace"] = token
+    return f"workspace:{token}"
+
+
+st.session_state.user_id = resolve_user_id()
+
+profile_checkpoint("session_state")
 
 # ✅ Enhanced Sidebar with Organized Categories
 st.sidebar.title("📚 Learning Modules")
@@ -263,14 +458,7 @@ st.sidebar.title("📚 Learning Modules")
 # ✅ Enhanced Stats Dashboard
 if st.session_state.mentor_type:
     # Track progress
-    if st.session_state.mentor_type not in st.session_state.user_progress:
-        st.session_state.user_progress[st.session_state.mentor_type] = {
-            'started': datetime.now().strftime('%Y-%m-%d %H:%M'),
-            'queries': 0,
-            'completed_topics': []
-        }
-
-    progress = st.session_state.user_progress[st.session_state.mentor_type]
+    progress = core.start_module(st.session_state, st.session_state.mentor_type)
     session_time = datetime.now() - st.session_state.session_start
 
     st.sidebar.markdown("### 📊 Session Dashboard")
@@ -320,31 +508,21 @@ if st.sidebar.button("🔖 My Bookmarks"):
 if st.sidebar.button("📝 My Notes"):
     st.session_state.show_notes = True
 
+if st.sidebar.button("🗂️ My Saved Files"):
+    st.session_state.show_artifacts = True
+
 # Export Options
 st.sidebar.markdown("### 📤 Export Options")
 if st.sidebar.button("📄 Export Progress Report"):
-    # Generate progress report
-    report = f"""
-# Quality Thought AI Mentor - Progress Report
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Session Summary
-- Total Queries: {st.session_state.total_queries}
-- Modules Explored: {len(st.session_state.user_progress)}
-- Session Duration: {datetime.now() - st.session_state.session_start}
-
-## Module Progress
-"""
-    for module, data in st.session_state.user_progress.items():
-        report += f"- {module}: Started {data['started']}, {data['queries']} queries\n"
-
     st.sidebar.download_button(
         "💾 Download Report",
-        report,
+        core.progress_report(st.session_state),
         file_name=f"learning_progress_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
         mime="text/plain"
     )
 
+profile_checkpoint("sidebar_modules")
+
 # ✅ Main Interaction Area (Your original functionality enhanced)
 if st.session_state.mentor_type:
     st.markdown(f"""
@@ -360,7 +538,7 @@ if st.session_state.mentor_type:
         experience = st.slider("Your experience (in years):", 0, 10, 1)
     with col2:
         lang = st.selectbox("Select Interface Language", 
-                           ["English", "Telugu", "Hindi", "Tamil", "Kannada", "Malayalam"], 
+                           interface_languages, 
                            index=0)
 
     # Default Templates (Your original)
@@ -385,15 +563,6 @@ if st.session_state.mentor_type:
         st.warning("⚠️ API Key not configured. Please add your OPENROUTER_API_KEY to use AI features.")
         st.info("💡 The app structure is ready - just add your API key to activate AI responses!")
 
-    # Prompt Setup (Your original)
-    if model:
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessagePromptTemplate.from_template(
-                f"You are a helpful and experienced {st.session_state.mentor_type.upper()} mentor assisting a user with {experience} years experience. Reply in {lang}."
-            ),
-            HumanMessagePromptTemplate.from_template("{question}")
-        ])
-
     # Check if this is a career/interview module for different button layout
     is_career_module = st.session_state.mentor_type in [module[0] for module in career_interview]
 
@@ -405,20 +574,14 @@ if st.session_state.mentor_type:
             if st.button("🎯 Get Interview Questions"):
                 if code_area and model:
                     try:
-                        interview_prompt = ChatPromptTemplate.from_messages([
-                            SystemMessagePromptTemplate.from_template(
-                                f"Generate relevant interview questions for {st.session_state.mentor_type}. "
-                                f"Provide practical questions with difficulty suitable for {experience} years experience. Reply in {lang}."
-                            ),
-                            HumanMessagePromptTemplate.from_template("{question}")
-                        ])
-                        messages = interview_prompt.format_messages(question=code_area)
-                        response = model.invoke(messages)
+                        response_text = run_core(core.interview_questions(
+                            model, st.session_state.mentor_type, code_area, experience, lang, **answer_options()
+                        ))
 
                         st.markdown("**📝 Your Topic:**")
                         st.info(code_area)
                         st.markdown("**🎯 Interview Questions:**")
-                        st.success(response.content)
+                        st.success(response_text)
                     except Exception as e:
                         output_container.error(f"❌ Error: {str(e)}")
                 else:
@@ -428,20 +591,14 @@ if st.session_state.mentor_type:
             if st.button("💡 Get Sample Answers"):
                 if code_area and model:
                     try:
-                        answer_prompt = ChatPromptTemplate.from_messages([
-                            SystemMessagePromptTemplate.from_template(
-                                f"Provide detailed sample answers for {st.session_state.mentor_type} questions. "
-                                f"Make answers suitable for {experience} years experience level. Reply in {lang}."
-                            ),
-                            HumanMessagePromptTemplate.from_template("{question}")
-                        ])
-                        messages = answer_prompt.format_messages(question=code_area)
-                        response = model.invoke(messages)
+                        response_text = run_core(core.sample_answers(
+                            model, st.session_state.mentor_type, code_area, experience, lang, **answer_options()
+                        ))
 
                         st.markdown("**❓ Your Question:**")
                         st.info(code_area)
                         st.markdown("**💡 Sample Answer:**")
-                        st.success(response.content)
+                        st.success(response_text)
                     except Exception as e:
                         output_container.error(f"❌ Error: {str(e)}")
                 else:
@@ -450,14 +607,16 @@ if st.session_state.mentor_type:
         with col3:
             if st.button("📄 Save Interview Prep"):
                 try:
-                    filename = f"interview_prep_{st.session_state.mentor_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                    with open(filename, "w") as f:
-                        f.write(f"# {st.session_state.mentor_type} Interview Preparation\n")
-                        f.write(f"# Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                        f.write(f"Topic/Question: {code_area}\n\n")
-                        f.write("=== NOTES ===\n")
-                        f.write("Add your preparation notes here...\n")
-                    st.success(f"✅ Interview prep saved as {filename}")
+                    filename = f"interview_prep_{st.session_state.mentor_type}.txt"
+                    core.save_artifact(
+                        st.session_state.user_id, "interview_prep", filename,
+                        f"# {st.session_state.mentor_type} Interview Preparation\n\n"
+                        f"Topic/Question: {code_area}\n\n"
+                        "=== NOTES ===\n"
+                        "Add your preparation notes here...\n",
+                        st.session_state.mentor_type
+                    )
+                    st.success(f"✅ Interview prep saved as {filename} (see 🗂️ My Saved Files)")
                 except Exception as e:
                     st.error(f"❌ Save error: {str(e)}")
 
@@ -471,38 +630,25 @@ if st.session_state.mentor_type:
                 if code_area:
                     if model:
                         try:
-                            messages = prompt.format_messages(question=code_area)
-                            response = model.invoke(messages)
+                            response_text = run_core(core.ask_mentor(
+                                model, st.session_state.mentor_type, code_area, experience, lang, **answer_options()
+                            ))
 
-                            # Update progress tracking
-                            st.session_state.total_queries += 1
-                            st.session_state.user_progress[st.session_state.mentor_type]['queries'] += 1
-
-                            # Add to chat history
-                            st.session_state.chat_history.append({
-                                'module': st.session_state.mentor_type,
-                                'question': code_area,
-                                'response': response.content,
-                                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            })
+                            # Update progress tracking and chat history
+                            core.record_query(st.session_state, st.session_state.mentor_type, code_area, response_text)
 
                             # Display user input and response cleanly
                             st.markdown("**👤 Your Question:**")
                             st.info(code_area)
                             st.markdown("**🧠 AI Mentor Response:**")
-                            st.success(response.content)
+                            st.success(response_text)
 
                             # Add bookmark option
                             col_bookmark, col_note = st.columns(2)
                             with col_bookmark:
                                 if st.button("🔖 Bookmark This", key="bookmark_response"):
-                                    bookmark = {
-                                        'module': st.session_state.mentor_type,
-                                        'question': code_area,
-                                        'response': response.content,
-                                        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                                    }
-                                    st.session_state.bookmarks.append(bookmark)
+                                    core.add_bookmark(st.session_state, st.session_state.mentor_type,
+                                                      code_area, response_text)
                                     st.success("✅ Bookmarked!")
 
                             with col_note:
@@ -518,24 +664,15 @@ if st.session_state.mentor_type:
         # 💻 Run Code (Your original functionality)
         with col2:
             if st.button("💻 Run Code"):
-                if st.session_state.mentor_type in ["Python", "Java", "C++"] and code_area:
+                if st.session_state.mentor_type in core.RUNNABLE_MODULES and code_area:
                     try:
-                        with open("temp_code.txt", "w") as f:
-                            f.write(code_area)
-
-                        if st.session_state.mentor_type == "Python":
-                            result = subprocess.run(["python", "temp_code.txt"], capture_output=True, text=True)
-                        elif st.session_state.mentor_type == "C++":
-                            subprocess.run(["g++", "temp_code.txt", "-o", "temp.out"], check=True)
-                            result = subprocess.run(["./temp.out"], capture_output=True, text=True)
-                        elif st.session_state.mentor_type == "Java":
-                            with open("Main.java", "w") as f:
-                                f.write(code_area)
-                            subprocess.run(["javac", "Main.java"], check=True)
-                            result = subprocess.run(["java", "Main"], capture_output=True, text=True)
+                        result = run_core(core.run_code(st.session_state.mentor_type, code_area,
+                                                        timeout=RUN_CODE_TIMEOUT), "run_code")
 
                         st.markdown("**💻 Code Output:**")
-                        st.code(result.stdout or result.stderr, language="text")
+                        st.code(result['stdout'] or result['stderr'], language="text")
+                    except asyncio.TimeoutError:
+                        output_container.error(f"Code execution error: stopped after {RUN_CODE_TIMEOUT} seconds. Check for infinite loops or waiting on input.")
                     except Exception as e:
                         output_container.error(f"Code execution error: {str(e)}")
                 else:
@@ -545,11 +682,13 @@ if st.session_state.mentor_type:
         with col3:
             if st.button("📥 Save Code"):
                 try:
-                    filename = f"saved_code_{st.session_state.mentor_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-                    with open(filename, "w") as f:
-                        f.write(f"# {st.session_state.mentor_type} Code - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                        f.write(code_area)
-                    st.success(f"✅ Code saved as {filename}")
+                    filename = f"saved_code_{st.session_state.mentor_type}.txt"
+                    core.save_artifact(
+                        st.session_state.user_id, "code", filename,
+                        f"# {st.session_state.mentor_type} Code\n\n{code_area}",
+                        st.session_state.mentor_type
+                    )
+                    st.success(f"✅ Code saved as {filename} (see 🗂️ My Saved Files)")
                 except Exception as e:
                     st.error(f"❌ Save error: {str(e)}")
 
@@ -561,9 +700,7 @@ if st.session_state.mentor_type:
         </div>
     """, unsafe_allow_html=True)
 
-    tool_choice = st.selectbox("Choose AI Tool", [
-        "Code Explainer", "Syntax Checker", "Interview Prep", "Resume Feedback", "Cheat Sheet Generator"
-    ], index=0)
+    tool_choice = st.selectbox("Choose AI Tool", core.TOOLS, index=0)
 
     tool_input = st.text_area("Enter your content or paste code/question here:", height=150)
 
@@ -571,17 +708,10 @@ if st.session_state.mentor_type:
         if tool_input:
             if model:
                 try:
-                    tool_prompt = ChatPromptTemplate.from_messages([
-                        SystemMessagePromptTemplate.from_template(
-                            f"You are a professional assistant for {tool_choice}. Provide accurate, clear, and brief output in {lang}."
-                        ),
-                        HumanMessagePromptTemplate.from_template("{question}")
-                    ])
-                    messages = tool_prompt.format_messages(question=tool_input)
-                    tool_result = model.invoke(messages)
+                    tool_result = run_core(core.run_tool(model, tool_choice, tool_input, lang, **answer_options()))
 
                     st.markdown(f"**🎯 {tool_choice} Result:**")
-                    st.success(tool_result.content)
+                    st.success(tool_result)
                 except Exception as e:
                     st.error(f"❌ Tool Error: {str(e)}")
             else:
@@ -636,17 +766,10 @@ else:
         if test_input.strip():
             if model:
                 try:
-                    test_prompt = ChatPromptTemplate.from_messages([
-                        SystemMessagePromptTemplate.from_template(
-                            "You are a helpful programming and technology mentor. Provide clear, concise, and educational responses."
-                        ),
-                        HumanMessagePromptTemplate.from_template("{question}")
-                    ])
-                    messages = test_prompt.format_messages(question=test_input)
-                    response = model.invoke(messages)
+                    response_text = run_core(core.test_mentor(model, test_input))
 
                     st.markdown("**🧪 Test Result:**")
-                    st.success(response.content)
+                    st.success(response_text)
                     st.success("✅ Test successful! Now select a module from the sidebar to start learning.")
                 except Exception as e:
                     st.error(f"❌ Test Error: {str(e)}")
@@ -655,14 +778,93 @@ else:
         else:
             st.warning("⚠️ Enter a test question first.")
 
+profile_checkpoint("main_area")
+
+# ✅ Paged List Rendering (cost per rerun bounded by page size, not history length)
+PAGE_SIZE = 10
+
+
+def filter_and_sort(items, list_key, search_fields, sort_options):
+    """Render filter/sort controls for a list and return the matching items in order."""
+    col_module, col_search, col_sort = st.columns(3)
+    modules = sorted({item['module'] for item in items})
+    with col_module:
+        module_filter = st.selectbox("Module", ["All"] + modules, key=f"{list_key}_module")
+    with col_search:
+        search = st.text_input("Search", key=f"{list_key}_search").strip().lower()
+    with col_sort:
+        sort_choice = st.selectbox("Sort by", list(sort_options.keys()), key=f"{list_key}_sort")
+
+    if module_filter != "All":
+        items = [item for item in items if item['module'] == module_filter]
+    if search:
+        items = [item for item in items
+                 if any(search in str(item.get(field, '')).lower() for field in search_fields)]
+    sort_key, reverse = sort_options[sort_choice]
+    return sorted(items, key=sort_key, reverse=reverse)
+
+
+def paginate(items, list_key):
+    """Render page navigation and return only the items on the current page."""
+    total_pages = max(1, math.ceil(len(items) / PAGE_SIZE))
+    page_key = f"{list_key}_page"
+    # Clicks are applied in on_click callbacks, before this rerun draws the buttons
+    page = min(max(st.session_state.get(page_key, 1), 1), total_pages)
+    st.session_state[page_key] = page
+
+    def turn_page(step):
+        st.session_state[page_key] = st.session_state[page_key] + step
+
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        st.button("⬅️ Previous", key=f"{list_key}_prev", disabled=page <= 1,
+                  on_click=turn_page, args=(-1,))
+    with col_next:
+        st.button("Next ➡️", key=f"{list_key}_next", disabled=page >= total_pages,
+                  on_click=turn_page, args=(1,))
+    with col_info:
+        st.markdown(f"Page {page} of {total_pages} • {len(items)} items")
+
+    start = (page - 1) * PAGE_SIZE
+    return items[start:start + PAGE_SIZE]
+
+
+def render_item_row(item_id, title, render_body, on_delete, delete_label):
+    """One list row; the body is only built once the learner opens it."""
+    # Toggles and deletes run as on_click callbacks, so the click's own rerun already shows the result
+    def toggle():
+        st.session_state.open_items ^= {item_id}
+
+    def delete():
+        on_delete(item_id)
+        st.session_state.open_items.discard(item_id)
+
+    is_open = item_id in st.session_state.open_items
+    col_title, col_toggle, col_delete = st.columns([6, 1, 1])
+    with col_title:
+        st.markdown(title)
+    with col_toggle:
+        st.button("🔼 Hide" if is_open else "🔽 View", key=f"toggle_{item_id}", on_click=toggle)
+    with col_delete:
+        st.button(delete_label, key=f"delete_{item_id}", on_click=delete)
+    if is_open:
+        render_body()
+
+
 # ✅ Additional Features Display
 if 'show_progress' in st.session_state and st.session_state.show_progress:
     st.markdown("### 📊 Learning Progress Dashboard")
     if st.session_state.user_progress:
-        for module, data in st.session_state.user_progress.items():
+        progress_items = [dict(data, module=module) for module, data in st.session_state.user_progress.items()]
+        progress_items = filter_and_sort(progress_items, "progress", ['module'], {
+            "Most queries": (lambda item: item['queries'], True),
+            "Recently started": (lambda item: item['started'], True),
+            "Module name": (lambda item: item['module'], False)
+        })
+        for data in paginate(progress_items, "progress"):
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric(f"📚 {module}", f"{data['queries']} queries")
+                st.metric(f"📚 {data['module']}", f"{data['queries']} queries")
             with col2:
                 st.metric("📅 Started", data['started'])
             with col3:
@@ -699,13 +901,20 @@ if 'show_roadmap' in st.session_state and st.session_state.show_roadmap:
 if 'show_bookmarks' in st.session_state and st.session_state.show_bookmarks:
     st.markdown("### 🔖 My Bookmarks")
     if st.session_state.bookmarks:
-        for i, bookmark in enumerate(st.session_state.bookmarks):
-            with st.expander(f"📌 {bookmark['module']} - {bookmark['timestamp']}"):
+        bookmark_items = filter_and_sort(list(st.session_state.bookmarks.values()), "bookmarks",
+                                         ['question', 'response'], {
+            "Newest first": (lambda item: item['timestamp'], True),
+            "Oldest first": (lambda item: item['timestamp'], False),
+            "Module name": (lambda item: item['module'], False)
+        })
+        for bookmark in paginate(bookmark_items, "bookmarks"):
+            def show_bookmark(bookmark=bookmark):
                 st.markdown(f"**Question:** {bookmark['question']}")
                 st.markdown(f"**Answer:** {bookmark['response']}")
-                if st.button(f"🗑️ Remove", key=f"remove_bookmark_{i}"):
-                    st.session_state.bookmarks.pop(i)
-                    st.rerun()
+
+            render_item_row(bookmark['id'], f"📌 {bookmark['module']} - {bookmark['timestamp']}",
+                            show_bookmark, lambda item_id: core.remove_bookmark(st.session_state, item_id),
+                            "🗑️ Remove")
     else:
         st.info("No bookmarks yet. Click '🔖 Bookmark This' on any AI response!")
 
@@ -718,29 +927,71 @@ if 'show_notes' in st.session_state and st.session_state.show_notes:
     # Add new note
     new_note = st.text_area("✍️ Add a new note:", height=100)
     if st.button("💾 Save Note") and new_note.strip():
-        note_key = f"note_{len(st.session_state.user_notes)}"
-        st.session_state.user_notes[note_key] = {
-            'content': new_note,
-            'module': st.session_state.mentor_type or 'General',
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+        core.add_note(st.session_state, new_note, st.session_state.mentor_type)
         st.success("✅ Note saved!")
         st.rerun()
 
     # Display existing notes
     if st.session_state.user_notes:
-        for note_key, note in st.session_state.user_notes.items():
-            with st.expander(f"📄 {note['module']} - {note['timestamp']}"):
-                st.markdown(note['content'])
-                if st.button(f"🗑️ Delete", key=f"delete_note_{note_key}"):
-                    del st.session_state.user_notes[note_key]
-                    st.rerun()
+        note_items = filter_and_sort(list(st.session_state.user_notes.values()), "notes", ['content'], {
+            "Newest first": (lambda item: item['timestamp'], True),
+            "Oldest first": (lambda item: item['timestamp'], False),
+            "Module name": (lambda item: item['module'], False)
+        })
+        for note in paginate(note_items, "notes"):
+            render_item_row(note['id'], f"📄 {note['module']} - {note['timestamp']}",
+                            lambda note=note: st.markdown(note['content']),
+                            lambda item_id: core.remove_note(st.session_state, item_id),
+                            "🗑️ Delete")
     else:
         st.info("No notes yet. Start taking notes to track your learning!")
 
     if st.button("❌ Close Notes"):
         del st.session_state.show_notes
 
+if 'show_artifacts' in st.session_state and st.session_state.show_artifacts:
+    st.markdown("### 🗂️ My Saved Files")
+    if st.session_state.user_id.startswith("workspace:"):
+        st.caption("🔗 Your files are tied to this page's link — bookmark it to find them again.")
+    artifacts = core.list_artifacts(st.session_state.user_id)
+    if artifacts:
+        artifact_items = filter_and_sort(artifacts, "artifacts", ['name', 'kind'], {
+            "Newest first": (lambda item: item['created'], True),
+            "Oldest first": (lambda item: item['created'], False),
+            "Module name": (lambda item: item['module'], False)
+        })
+        for artifact in paginate(artifact_items, "artifacts"):
+            def show_artifact(artifact=artifact):
+                st.markdown(f"**Type:** {artifact['kind']} • **Size:** {artifact['size']} bytes")
+                st.download_button(
+                    "💾 Download",
+                    # download_button needs the whole payload up front
+                    b"".join(core.iter_artifact(st.session_state.user_id, artifact['id'])),
+                    file_name=artifact['name'],
+                    mime="text/plain",
+                    key=f"download_{artifact['id']}"
+                )
+
+            render_item_row(artifact['id'], f"📁 {artifact['name']} - {artifact['created'].replace('T', ' ')}",
+                            show_artifact, lambda item_id: core.delete_artifact(st.session_state.user_id, item_id),
+                            "🗑️ Delete")
+
+        # Only build the bundle when asked for it, not on every rerun
+        if st.button("📦 Prepare ZIP Bundle"):
+            st.download_button(
+                "💾 Download All (ZIP)",
+                core.zip_bundle(st.session_state.user_id).read(),
+                file_name=f"mentor_files_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+                mime="application/zip"
+            )
+    else:
+        st.info("No saved files yet. Use '📥 Save Code' or '📄 Save Interview Prep' to keep your work!")
+
+    if st.button("❌ Close Saved Files"):
+        del st.session_state.show_artifacts
+
+profile_checkpoint("saved_lists")
+
 # ✅ Professional Footer
 st.markdown("---")
 st.markdown("### 🧠 Quality Thought AI Mentor")
@@ -764,3 +1015,22 @@ st.markdown("""
     <p><em>Professional Edition • Real-time API Integration • Advanced Learning Platform</em></p>
 </div>
 """, unsafe_allow_html=True)
+profile_checkpoint("footer")
+
+# ✅ Profiling Panel (only when profiling is enabled)
+if profiling_enabled:
+    if rerun_profiler is not None and _take_active_profiler(rerun_profiler) is not None:
+        _merge_profiler(rerun_profiler)
+
+    with st.sidebar.expander("⏱️ Rerun Profile", expanded=True):
+        st.metric("This Rerun", f"{(time.perf_counter() - rerun_start) * 1000:.0f} ms")
+        st.table([
+            {'Section': name, 'ms': round(elapsed * 1000, 1)}
+            for name, elapsed in sorted(rerun_timings.items(), key=lambda item: -item[1])
+        ])
+        st.download_button(
+            "💾 Download Profile Report",
+            profile_report(),
+            file_name=f"rerun_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+            mime="text/plain"
+        )
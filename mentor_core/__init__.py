@@ -0,0 +1,27 @@
+"""Headless core of the Quality Thought AI Mentor.
+
+The Streamlit app in AIMentor9.py is a thin client over this package; workers
+and benchmarks can import it directly and call the async API concurrently.
+"""
+from .answers import INTERFACE_LANGUAGES, CANONICAL_LANG, generate_answer, translate_answer
+from .api import TOOLS, ask_mentor, interview_questions, sample_answers, run_tool, test_mentor
+from .execution import RUNNABLE_MODULES, run_code
+from .progress import (
+    new_session_state, start_module, record_query, add_bookmark, remove_bookmark,
+    add_note, remove_note, progress_report
+)
+from .model import create_model
+from .runner import run_sync
+from .artifacts import (
+    save_artifact, list_artifacts, delete_artifact, open_artifact, iter_artifact, zip_bundle
+)
+
+__all__ = [
+    "INTERFACE_LANGUAGES", "CANONICAL_LANG", "generate_answer", "translate_answer",
+    "TOOLS", "ask_mentor", "interview_questions", "sample_answers", "run_tool", "test_mentor",
+    "RUNNABLE_MODULES", "run_code",
+    "new_session_state", "start_module", "record_query", "add_bookmark", "remove_bookmark",
+    "add_note", "remove_note", "progress_report",
+    "create_model", "run_sync",
+    "save_artifact", "list_artifacts", "delete_artifact", "open_artifact", "iter_artifact", "zip_bundle",
+]
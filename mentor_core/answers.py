@@ -0,0 +1,153 @@
+"""LLM calls, plus the English answer cache and its cached translations."""
+import asyncio
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+
+from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
+
+INTERFACE_LANGUAGES = ["English", "Telugu", "Hindi", "Tamil", "Kannada", "Malayalam"]
+CANONICAL_LANG = "English"
+ANSWER_CACHE_SIZE = 256
+PREFETCH_WAIT_TIMEOUT = 20
+CODE_SPAN_PATTERN = re.compile(r"```.*?```|`[^`\n]+`", re.DOTALL)
+
+logger = logging.getLogger(__name__)
+
+# Shared by every caller in the process: canonical answers, translations, in-flight prefetch tasks
+_canonical_answers = OrderedDict()
+_translations = OrderedDict()
+_pending = {}
+_lock = threading.Lock()
+
+
+def _cache_get(cache, key):
+    with _lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    return None
+
+
+def _cache_put(cache, key, value):
+    with _lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > ANSWER_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+async def invoke_prompt(model, system_text, question):
+    prompt = ChatPromptTemplate.from_messages([
+        SystemMessagePromptTemplate.from_template(system_text),
+        HumanMessagePromptTemplate.from_template("{question}")
+    ])
+    response = await model.ainvoke(prompt.format_messages(question=question))
+    return response.content
+
+
+async def get_canonical_answer(model, system_text, question):
+    key = _hash(f"{system_text}\n{question}")
+    answer = _cache_get(_canonical_answers, key)
+    if answer is None:
+        answer = await invoke_prompt(model, f"{system_text} Reply in {CANONICAL_LANG}.", question)
+        _cache_put(_canonical_answers, key, answer)
+    return answer
+
+
+async def _translate(model, answer, lang):
+    # Swap code spans for placeholders so the model never rewrites code
+    code_spans = []
+
+    def stash(match):
+        code_spans.append(match.group(0))
+        return f"[[CODE_{len(code_spans) - 1}]]"
+
+    prose = CODE_SPAN_PATTERN.sub(stash, answer)
+    translated = await invoke_prompt(
+        model,
+        f"You are a professional technical translator. Translate the user's text into {lang}. "
+        "Keep markdown formatting and every [[CODE_n]] placeholder exactly as written. "
+        "Output only the translation.",
+        prose
+    )
+    for i, span in enumerate(code_spans):
+        placeholder = f"[[CODE_{i}]]"
+        if placeholder in translated:
+            translated = translated.replace(placeholder, span)
+        else:
+            translated += f"\n\n{span}"
+    return translated
+
+
+async def translate_answer(model, answer, lang):
+    if lang == CANONICAL_LANG:
+        return answer
+    key = (_hash(answer), lang)
+    translated = _cache_get(_translations, key)
+    if translated is not None:
+        return translated
+    with _lock:
+        task = _pending.get(key)
+    if task is not None and task.get_loop() is asyncio.get_running_loop():
+        # A background prefetch is already on it; don't let a stuck one hold up the learner
+        try:
+            translated = await asyncio.wait_for(asyncio.shield(task), PREFETCH_WAIT_TIMEOUT)
+        except Exception:
+            translated = None
+        if translated is not None:
+            return translated
+    # A prefetch may have finished between the cache check and the pending lookup
+    translated = _cache_get(_translations, key)
+    if translated is not None:
+        return translated
+    translated = await _translate(model, answer, lang)
+    _cache_put(_translations, key, translated)
+    return translated
+
+
+def prefetch_translations(model, answer, languages):
+    """Translate `answer` into `languages` as background tasks on the running loop, filling the cache.
+
+    The tasks share the caller's loop, and so the model's async client; callers
+    should keep that loop alive (see `runner.run_sync`) for prefetches to finish.
+    """
+    answer_hash = _hash(answer)
+    loop = asyncio.get_running_loop()
+
+    async def run(key, lang):
+        # Nobody awaits a prefetch unless a learner asks for that language, so failures end here;
+        # translate_answer falls back to translating on demand
+        try:
+            translated = await _translate(model, answer, lang)
+            _cache_put(_translations, key, translated)
+            return translated
+        except Exception:
+            logger.warning("Prefetching the %s translation failed", lang, exc_info=True)
+            return None
+        finally:
+            with _lock:
+                _pending.pop(key, None)
+
+    for lang in languages:
+        key = (answer_hash, lang)
+        with _lock:
+            if key in _translations or key in _pending:
+                continue
+            _pending[key] = loop.create_task(run(key, lang))
+
+
+async def generate_answer(model, system_text, question, lang, derive_translations=False, prefetch_languages=()):
+    """Answer in `lang`, deriving non-English replies from a cached English answer when enabled."""
+    if not derive_translations:
+        return await invoke_prompt(model, f"{system_text} Reply in {lang}.", question)
+    canonical = await get_canonical_answer(model, system_text, question)
+    prefetch_translations(model, canonical,
+                          [l for l in prefetch_languages if l not in (lang, CANONICAL_LANG)])
+    return await translate_answer(model, canonical, lang)
@@ -0,0 +1,35 @@
+"""Async entry points for the mentor features, usable outside Streamlit."""
+from .answers import generate_answer, invoke_prompt
+from .prompts import (
+    mentor_prompt, interview_questions_prompt, sample_answers_prompt, tool_prompt, TEST_PROMPT
+)
+
+TOOLS = ["Code Explainer", "Syntax Checker", "Interview Prep", "Resume Feedback", "Cheat Sheet Generator"]
+
+
+async def ask_mentor(model, module, question, experience=1, lang="English",
+                     derive_translations=False, prefetch_languages=()):
+    return await generate_answer(model, mentor_prompt(module, experience), question, lang,
+                                 derive_translations, prefetch_languages)
+
+
+async def interview_questions(model, module, topic, experience=1, lang="English",
+                              derive_translations=False, prefetch_languages=()):
+    return await generate_answer(model, interview_questions_prompt(module, experience), topic, lang,
+                                 derive_translations, prefetch_languages)
+
+
+async def sample_answers(model, module, question, experience=1, lang="English",
+                         derive_translations=False, prefetch_languages=()):
+    return await generate_answer(model, sample_answers_prompt(module, experience), question, lang,
+                                 derive_translations, prefetch_languages)
+
+
+async def run_tool(model, tool_choice, tool_input, lang="English",
+                   derive_translations=False, prefetch_languages=()):
+    return await generate_answer(model, tool_prompt(tool_choice), tool_input, lang,
+                                 derive_translations, prefetch_languages)
+
+
+async def test_mentor(model, question):
+    return await invoke_prompt(model, TEST_PROMPT, question)
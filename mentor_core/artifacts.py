@@ -0,0 +1,329 @@
+"""Content-addressed store for saved code and interview prep files.
+
+Contents are gzip-compressed under objects/<sha256[:2]>/<sha256[2:]>.gz and
+shared between every entry that references them. Each user has a JSON index
+of their entries; retention and quota policies evict the oldest entries and
+delete objects nobody references any more. Empty indexes and shard
+directories are removed, and past MAX_ARTIFACT_USERS the user whose last
+save is oldest is evicted, so disk use stays under roughly
+MAX_ARTIFACT_USERS * MAX_BYTES_PER_USER. Only the most recently used indexes
+are kept in memory. Disk writes run on a single background worker, so saving
+never blocks the caller and writes stay ordered.
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+ARTIFACT_DIR = os.getenv("AIMENTOR_ARTIFACT_DIR", ".mentor_artifacts")
+MAX_ARTIFACTS_PER_USER = int(os.getenv("AIMENTOR_MAX_ARTIFACTS", "100"))
+MAX_BYTES_PER_USER = int(os.getenv("AIMENTOR_MAX_ARTIFACT_BYTES", str(5 * 1024 * 1024)))
+MAX_ARTIFACT_USERS = int(os.getenv("AIMENTOR_MAX_ARTIFACT_USERS", "1000"))
+RETENTION_DAYS = int(os.getenv("AIMENTOR_ARTIFACT_RETENTION_DAYS", "30"))
+INDEX_CACHE_SIZE = 256
+SWEEP_INTERVAL = 3600
+CHUNK_SIZE = 64 * 1024
+
+_indexes = OrderedDict()
+_dirty = set()
+_users = None  # user key -> time of their latest save, from the newest index entry
+_refcounts = None
+_last_sweep = 0.0
+_lock = threading.RLock()
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="artifacts")
+
+
+def _user_key(user_id):
+    return hashlib.sha256(str(user_id).encode("utf-8")).hexdigest()[:32]
+
+
+def _object_path(digest):
+    return os.path.join(ARTIFACT_DIR, "objects", digest[:2], f"{digest[2:]}.gz")
+
+
+def _index_dir():
+    return os.path.join(ARTIFACT_DIR, "index")
+
+
+def _index_path(user_key):
+    return os.path.join(_index_dir(), f"{user_key}.json")
+
+
+def _index_keys_on_disk():
+    if not os.path.isdir(_index_dir()):
+        return []
+    return [filename[:-len(".json")] for filename in os.listdir(_index_dir()) if filename.endswith(".json")]
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _read_index(user_key):
+    # Cached copy if there is one, otherwise straight from disk without caching it
+    with _lock:
+        if user_key in _indexes:
+            return _indexes[user_key]
+        try:
+            with open(_index_path(user_key)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+
+def _load_index(user_key):
+    with _lock:
+        if user_key in _indexes:
+            _indexes.move_to_end(user_key)
+            return _indexes[user_key]
+        _indexes[user_key] = _read_index(user_key)
+        # Drop least recently used indexes that are already on disk
+        for key in list(_indexes):
+            if len(_indexes) <= INDEX_CACHE_SIZE:
+                break
+            if key != user_key and key not in _dirty:
+                del _indexes[key]
+        return _indexes[user_key]
+
+
+def _ensure_registry():
+    # Built once per process from every index on disk, then kept up to date in memory
+    global _refcounts, _users
+    with _lock:
+        if _refcounts is None:
+            _refcounts = {}
+            _users = {}
+            for user_key in _index_keys_on_disk():
+                index = _read_index(user_key)
+                if index:
+                    _users[user_key] = index[-1]['created']
+                for entry in index:
+                    _refcounts[entry['sha256']] = _refcounts.get(entry['sha256'], 0) + 1
+        return _refcounts
+
+
+def _release(digest):
+    refcounts = _ensure_registry()
+    refcounts[digest] -= 1
+    if refcounts[digest] <= 0:
+        del refcounts[digest]
+        _executor.submit(_delete_object, digest)
+
+
+def _apply_policies(index):
+    """Evict expired and over-quota entries, oldest first; returns whether anything was removed."""
+    removed = False
+    cutoff = (datetime.now() - timedelta(days=RETENTION_DAYS)).isoformat(timespec="seconds")
+    while index and index[0]['created'] < cutoff:
+        _release(index.pop(0)['sha256'])
+        removed = True
+    total_bytes = sum(entry['size'] for entry in index)
+    while index and (len(index) > MAX_ARTIFACTS_PER_USER or total_bytes > MAX_BYTES_PER_USER):
+        entry = index.pop(0)
+        total_bytes -= entry['size']
+        _release(entry['sha256'])
+        removed = True
+    return removed
+
+
+def _store_object(digest, data):
+    path = _object_path(digest)
+    if not os.path.exists(path):
+        _write_atomic(path, gzip.compress(data))
+
+
+def _delete_object(digest):
+    with _lock:
+        # Someone may have saved the same content again since it was released
+        if digest in _ensure_registry():
+            return
+    path = _object_path(digest)
+    try:
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+    except OSError:
+        # Already gone, or the shard directory still holds other objects
+        pass
+
+
+def _write_index(user_key, index):
+    # Empty indexes are removed rather than written, and the user stops counting towards the cap
+    _ensure_registry()
+    if index:
+        _write_atomic(_index_path(user_key), json.dumps(index).encode("utf-8"))
+        return
+    try:
+        os.remove(_index_path(user_key))
+    except FileNotFoundError:
+        pass
+    _indexes.pop(user_key, None)
+    _users.pop(user_key, None)
+
+
+def _mark_dirty(user_key):
+    _dirty.add(user_key)
+    _executor.submit(_flush_index, user_key)
+
+
+def _flush_index(user_key):
+    with _lock:
+        if user_key in _dirty and user_key in _indexes:
+            _dirty.discard(user_key)
+            _write_index(user_key, _indexes[user_key])
+
+
+def _evict_users(keep):
+    # Past the user cap, drop whole indexes of the users whose last save is oldest
+    with _lock:
+        _ensure_registry()
+        candidates = sorted(
+            (last_active, user_key) for user_key, last_active in _users.items()
+            if user_key != keep and user_key not in _dirty
+        )
+        for _, user_key in candidates:
+            if len(_users) <= MAX_ARTIFACT_USERS:
+                break
+            for entry in _read_index(user_key):
+                _release(entry['sha256'])
+            _write_index(user_key, [])
+
+
+def _sweep():
+    # Applies retention to every user, including ones who have not saved anything lately;
+    # only indexes that actually lost entries are rewritten
+    for user_key in _index_keys_on_disk():
+        with _lock:
+            if user_key in _indexes:
+                if _apply_policies(_indexes[user_key]):
+                    _dirty.add(user_key)
+                    _flush_index(user_key)
+            else:
+                index = _read_index(user_key)
+                if _apply_policies(index):
+                    _write_index(user_key, index)
+
+
+def save_artifact(user_id, kind, name, content, module=None):
+    """Record `content` for `user_id` and return its index entry; the disk write happens in the background.
+
+    Raises ValueError if `content` alone exceeds MAX_BYTES_PER_USER.
+    """
+    global _last_sweep
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    if len(data) > MAX_BYTES_PER_USER:
+        # The quota would evict it straight away, so refuse instead of reporting a save that didn't stick
+        raise ValueError(f"File is too large to save ({len(data)} bytes; the limit is {MAX_BYTES_PER_USER} bytes).")
+    digest = hashlib.sha256(data).hexdigest()
+    user_key = _user_key(user_id)
+
+    with _lock:
+        refcounts = _ensure_registry()
+        index = _load_index(user_key)
+        duplicate = next((entry for entry in index if entry['sha256'] == digest and entry['kind'] == kind), None)
+        if duplicate is not None:
+            # Same file saved again: refresh it instead of adding another entry
+            index.remove(duplicate)
+            entry = duplicate
+            entry['created'] = datetime.now().isoformat(timespec="seconds")
+        else:
+            entry = {
+                'id': uuid.uuid4().hex,
+                'kind': kind,
+                'name': name,
+                'module': module or 'General',
+                'sha256': digest,
+                'size': len(data),
+                'created': datetime.now().isoformat(timespec="seconds")
+            }
+            refcounts[digest] = refcounts.get(digest, 0) + 1
+            if refcounts[digest] == 1:
+                _executor.submit(_store_object, digest, data)
+        index.append(entry)
+        _apply_policies(index)
+        _mark_dirty(user_key)
+        is_new_user = user_key not in _users
+        _users[user_key] = entry['created']
+        if is_new_user and len(_users) > MAX_ARTIFACT_USERS:
+            _executor.submit(_evict_users, user_key)
+        run_sweep = time.monotonic() - _last_sweep > SWEEP_INTERVAL
+        if run_sweep:
+            _last_sweep = time.monotonic()
+
+    if run_sweep:
+        _executor.submit(_sweep)
+    return dict(entry)
+
+
+def list_artifacts(user_id):
+    """Entries for `user_id`, newest first."""
+    with _lock:
+        return [dict(entry) for entry in reversed(_read_index(_user_key(user_id)))]
+
+
+def delete_artifact(user_id, artifact_id):
+    user_key = _user_key(user_id)
+    with _lock:
+        index = _load_index(user_key)
+        entry = next((entry for entry in index if entry['id'] == artifact_id), None)
+        if entry is None:
+            return None
+        index.remove(entry)
+        _release(entry['sha256'])
+        _mark_dirty(user_key)
+    return entry
+
+
+def _find(user_id, artifact_id):
+    with _lock:
+        for entry in _read_index(_user_key(user_id)):
+            if entry['id'] == artifact_id:
+                return dict(entry)
+    raise KeyError(artifact_id)
+
+
+def open_artifact(user_id, artifact_id):
+    """Binary file object with the decompressed contents of one artifact."""
+    entry = _find(user_id, artifact_id)
+    path = _object_path(entry['sha256'])
+    if not os.path.exists(path):
+        # Writes are queued in order on the single worker; wait for ours to land
+        _executor.submit(lambda: None).result()
+    return gzip.open(path, "rb")
+
+
+def iter_artifact(user_id, artifact_id):
+    with open_artifact(user_id, artifact_id) as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+def zip_bundle(user_id):
+    """Spooled temp file holding a zip of all of `user_id`'s artifacts, rewound for reading.
+
+    Headless callers can stream it; Streamlit's download_button only accepts
+    bytes or buffered files, so the app passes `.read()`.
+    """
+    bundle = tempfile.SpooledTemporaryFile(max_size=MAX_BYTES_PER_USER)
+    with zipfile.ZipFile(bundle, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for entry in list_artifacts(user_id):
+            arcname = f"{entry['kind']}/{entry['created'].replace(':', '')}_{entry['id'][:8]}_{entry['name']}"
+            with zf.open(arcname, "w") as out:
+                for chunk in iter_artifact(user_id, entry['id']):
+                    out.write(chunk)
+    bundle.seek(0)
+    return bundle
@@ -0,0 +1,55 @@
+"""Running learner code for the modules that support it."""
+import asyncio
+import os
+import sys
+import tempfile
+
+RUNNABLE_MODULES = ["Python", "Java", "C++"]
+
+
+async def _run(*args, cwd, timeout=None):
+    process = await asyncio.create_subprocess_exec(
+        *args, cwd=cwd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+    return {
+        'stdout': stdout.decode(errors="replace"),
+        'stderr': stderr.decode(errors="replace"),
+        'returncode': process.returncode
+    }
+
+
+async def _compile(*args, cwd, timeout=None):
+    result = await _run(*args, cwd=cwd, timeout=timeout)
+    if result['returncode'] != 0:
+        raise RuntimeError(f"Compilation failed:\n{result['stderr']}")
+
+
+async def run_code(module, code, timeout=None):
+    """Run `code` for a Python, C++ or Java module in a private temp directory."""
+    if module not in RUNNABLE_MODULES:
+        raise ValueError(f"Code execution is supported for {', '.join(RUNNABLE_MODULES)} only.")
+
+    with tempfile.TemporaryDirectory(prefix="mentor_run_") as workdir:
+        if module == "Python":
+            source = "main.py"
+        elif module == "C++":
+            source = "main.cpp"
+        else:
+            source = "Main.java"
+        with open(os.path.join(workdir, source), "w") as f:
+            f.write(code)
+
+        if module == "Python":
+            return await _run(sys.executable, source, cwd=workdir, timeout=timeout)
+        elif module == "C++":
+            await _compile("g++", source, "-o", "main.out", cwd=workdir, timeout=timeout)
+            return await _run(os.path.join(workdir, "main.out"), cwd=workdir, timeout=timeout)
+        else:
+            await _compile("javac", source, cwd=workdir, timeout=timeout)
+            return await _run("java", "-cp", workdir, "Main", cwd=workdir, timeout=timeout)
@@ -0,0 +1,12 @@
+"""Chat model construction."""
+from langchain_community.chat_models import ChatOpenAI
+
+
+def create_model(openrouter_api_key):
+    return ChatOpenAI(
+        model_name="mistralai/mistral-7b-instruct:free",
+        temperature=0.5,
+        max_tokens=500,
+        openai_api_key=openrouter_api_key,
+        base_url="https://openrouter.ai/api/v1"
+    )
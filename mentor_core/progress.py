@@ -0,0 +1,92 @@
+"""Progress, chat history, bookmark and note bookkeeping.
+
+`state` is any mapping with item access: a plain dict from `new_session_state()`
+for headless callers, or `st.session_state` in the Streamlit app.
+"""
+import uuid
+from datetime import datetime
+
+
+def _now():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def new_session_state():
+    return {
+        'user_id': uuid.uuid4().hex,
+        'user_progress': {},
+        'chat_history': [],
+        'bookmarks': {},
+        'user_notes': {},
+        'session_start': datetime.now(),
+        'total_queries': 0
+    }
+
+
+def start_module(state, module):
+    if module not in state['user_progress']:
+        state['user_progress'][module] = {
+            'started': datetime.now().strftime('%Y-%m-%d %H:%M'),
+            'queries': 0,
+            'completed_topics': []
+        }
+    return state['user_progress'][module]
+
+
+def record_query(state, module, question, response):
+    start_module(state, module)['queries'] += 1
+    state['total_queries'] += 1
+    state['chat_history'].append({
+        'module': module,
+        'question': question,
+        'response': response,
+        'timestamp': _now()
+    })
+
+
+def add_bookmark(state, module, question, response):
+    bookmark_id = uuid.uuid4().hex
+    state['bookmarks'][bookmark_id] = {
+        'id': bookmark_id,
+        'module': module,
+        'question': question,
+        'response': response,
+        'timestamp': _now()
+    }
+    return bookmark_id
+
+
+def remove_bookmark(state, bookmark_id):
+    return state['bookmarks'].pop(bookmark_id, None)
+
+
+def add_note(state, content, module=None):
+    note_key = f"note_{uuid.uuid4().hex}"
+    state['user_notes'][note_key] = {
+        'id': note_key,
+        'content': content,
+        'module': module or 'General',
+        'timestamp': _now()
+    }
+    return note_key
+
+
+def remove_note(state, note_key):
+    return state['user_notes'].pop(note_key, None)
+
+
+def progress_report(state):
+    report = f"""
+# Quality Thought AI Mentor - Progress Report
+Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+
+## Session Summary
+- Total Queries: {state['total_queries']}
+- Modules Explored: {len(state['user_progress'])}
+- Session Duration: {datetime.now() - state['session_start']}
+
+## Module Progress
+"""
+    for module, data in state['user_progress'].items():
+        report += f"- {module}: Started {data['started']}, {data['queries']} queries\n"
+    return report
@@ -0,0 +1,22 @@
+"""System prompts for the mentor, career and tool features."""
+
+
+def mentor_prompt(module, experience):
+    return f"You are a helpful and experienced {module.upper()} mentor assisting a user with {experience} years experience."
+
+
+def interview_questions_prompt(module, experience):
+    return (f"Generate relevant interview questions for {module}. "
+            f"Provide practical questions with difficulty suitable for {experience} years experience.")
+
+
+def sample_answers_prompt(module, experience):
+    return (f"Provide detailed sample answers for {module} questions. "
+            f"Make answers suitable for {experience} years experience level.")
+
+
+def tool_prompt(tool_choice):
+    return f"You are a professional assistant for {tool_choice}. Provide accurate, clear, and brief output."
+
+
+TEST_PROMPT = "You are a helpful programming and technology mentor. Provide clear, concise, and educational responses."
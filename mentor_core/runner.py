@@ -0,0 +1,25 @@
+"""A long-lived event loop for synchronous callers such as the Streamlit script.
+
+The model's async HTTP client is bound to the loop it first runs on, so every
+call from the app goes through this one loop instead of a fresh `asyncio.run`.
+Background prefetches scheduled by those calls keep running on it as well.
+"""
+import asyncio
+import threading
+
+_loop = None
+_lock = threading.Lock()
+
+
+def get_loop():
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="mentor-core-loop", daemon=True).start()
+        return _loop
+
+
+def run_sync(coro, timeout=None):
+    """Run `coro` on the shared loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result(timeout)
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from mentor_core import answers
+
+
+class FakeModel:
+    """Stands in for the chat model: records prompts and echoes the question back."""
+
+    def __init__(self, reply=None):
+        self.calls = []
+        self.reply = reply or (lambda system, question: f"answer to: {question}")
+
+    async def ainvoke(self, messages):
+        system, question = messages[0].content, messages[-1].content
+        self.calls.append((system, question))
+        await asyncio.sleep(0)
+        return type("Response", (), {'content': self.reply(system, question)})()
+
+
+@pytest.fixture
+def make_model():
+    """Factory for fake models with a custom `reply(system, question)`."""
+    return FakeModel
+
+
+@pytest.fixture
+def model(make_model):
+    return make_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_answer_caches():
+    answers._canonical_answers.clear()
+    answers._translations.clear()
+    answers._pending.clear()
+    yield
@@ -0,0 +1,101 @@
+import asyncio
+
+from mentor_core import answers, ask_mentor, generate_answer
+
+
+def test_ask_mentor_without_derivation_asks_in_the_selected_language(model):
+    result = asyncio.run(ask_mentor(model, "Python", "What is a list?", experience=2, lang="Hindi"))
+
+    assert result == "answer to: What is a list?"
+    system, question = model.calls[0]
+    assert "PYTHON mentor" in system and "2 years" in system
+    assert system.endswith("Reply in Hindi.")
+
+
+def test_without_derivation_every_call_hits_the_model(model):
+    asyncio.run(generate_answer(model, "Mentor.", "q", "Tamil"))
+    asyncio.run(generate_answer(model, "Mentor.", "q", "Tamil"))
+
+    assert len(model.calls) == 2
+
+
+def test_derivation_generates_english_once_and_caches_translations(make_model):
+    model = make_model(lambda system, question: f"[{system.split()[-1]}] {question}")
+
+    async def ask(lang):
+        return await generate_answer(model, "Mentor.", "q", lang, derive_translations=True)
+
+    english = asyncio.run(ask("English"))
+    telugu = asyncio.run(ask("Telugu"))
+    telugu_again = asyncio.run(ask("Telugu"))
+
+    assert english == "[English.] q"
+    assert telugu == telugu_again
+    # One canonical generation plus one translation; the repeat is a cache hit
+    assert len(model.calls) == 2
+    assert model.calls[1][0].startswith("You are a professional technical translator")
+    assert model.calls[1][1] == english
+
+
+def test_translation_keeps_code_spans_untouched(make_model):
+    canonical = "Use `len(x)` here:\n```python\nprint('hi')\n```\nDone."
+
+    def reply(system, question):
+        if "translator" in system:
+            # Drop one placeholder to check it still ends up in the answer
+            return question.replace("Use", "USE").replace("[[CODE_1]]", "")
+        return canonical
+
+    model = make_model(reply)
+    result = asyncio.run(generate_answer(model, "Mentor.", "q", "Kannada", derive_translations=True))
+
+    translator_input = model.calls[1][1]
+    assert "`len(x)`" not in translator_input and "print('hi')" not in translator_input
+    assert "[[CODE_0]]" in translator_input and "[[CODE_1]]" in translator_input
+    assert result.startswith("USE `len(x)` here:")
+    assert "```python\nprint('hi')\n```" in result
+    assert "[[CODE_" not in result
+
+
+def test_prefetch_fills_the_cache_for_cohort_languages(model):
+
+    async def ask_then_wait():
+        await generate_answer(model, "Mentor.", "q", "Hindi", derive_translations=True,
+                              prefetch_languages=["Tamil", "Malayalam", "Hindi"])
+        for _ in range(100):
+            if not answers._pending:
+                break
+            await asyncio.sleep(0)
+        return await generate_answer(model, "Mentor.", "q", "Tamil", derive_translations=True)
+
+    asyncio.run(ask_then_wait())
+
+    # Canonical, Hindi, and prefetched Tamil and Malayalam; the later Tamil ask is served from cache
+    assert len(model.calls) == 4
+
+
+def test_failed_prefetch_is_logged_and_translated_on_demand(make_model, caplog):
+    failures = {"Tamil": 1}
+
+    def reply(system, question):
+        for lang in failures:
+            if f"into {lang}" in system and failures[lang]:
+                failures[lang] -= 1
+                raise RuntimeError("429 Too Many Requests")
+        return f"answer to: {question}"
+
+    model = make_model(reply)
+
+    async def ask_then_wait():
+        await generate_answer(model, "Mentor.", "q", "Hindi", derive_translations=True,
+                              prefetch_languages=["Tamil"])
+        for _ in range(100):
+            if not answers._pending:
+                break
+            await asyncio.sleep(0)
+        return await generate_answer(model, "Mentor.", "q", "Tamil", derive_translations=True)
+
+    result = asyncio.run(ask_then_wait())
+
+    assert result == "answer to: answer to: q"
+    assert "Prefetching the Tamil translation failed" in caplog.text
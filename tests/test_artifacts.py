@@ -0,0 +1,140 @@
+import os
+import zipfile
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+import pytest
+
+from mentor_core import artifacts
+from mentor_core import save_artifact, list_artifacts, delete_artifact, iter_artifact, zip_bundle
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "ARTIFACT_DIR", str(tmp_path))
+    monkeypatch.setattr(artifacts, "_indexes", OrderedDict())
+    monkeypatch.setattr(artifacts, "_dirty", set())
+    monkeypatch.setattr(artifacts, "_users", None)
+    monkeypatch.setattr(artifacts, "_refcounts", None)
+    yield tmp_path
+    # Finish queued writes before the next test points ARTIFACT_DIR elsewhere
+    drain()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Makes the store's clock move forward one minute per save."""
+    class Clock(datetime):
+        ticks = 0
+
+        @classmethod
+        def now(cls, tz=None):
+            cls.ticks += 1
+            return datetime(2026, 1, 1) + timedelta(minutes=cls.ticks)
+
+    monkeypatch.setattr(artifacts, "datetime", Clock)
+    return Clock
+
+
+def drain():
+    artifacts._executor.submit(lambda: None).result()
+
+
+def files_under(path):
+    return sorted(os.path.relpath(os.path.join(root, name), path)
+                  for root, _, names in os.walk(path) for name in names)
+
+
+def dirs_under(path):
+    return sorted(os.path.relpath(os.path.join(root, name), path)
+                  for root, names, _ in os.walk(path) for name in names)
+
+
+def test_same_content_is_stored_once_and_refreshed(store):
+    first = save_artifact("alice", "code", "a.txt", "print(1)")
+    second = save_artifact("alice", "code", "a.txt", "print(1)")
+    save_artifact("bob", "code", "b.txt", "print(1)")
+    drain()
+
+    assert first['id'] == second['id']
+    assert len(list_artifacts("alice")) == 1
+    assert len([f for f in files_under(store) if f.startswith("objects")]) == 1
+    assert b"".join(iter_artifact("alice", first['id'])) == b"print(1)"
+
+
+def test_index_survives_a_process_restart(store, monkeypatch):
+    entry = save_artifact("alice", "code", "a.txt", "x = 1")
+    drain()
+    monkeypatch.setattr(artifacts, "_indexes", OrderedDict())
+    monkeypatch.setattr(artifacts, "_users", None)
+    monkeypatch.setattr(artifacts, "_refcounts", None)
+
+    assert [e['id'] for e in list_artifacts("alice")] == [entry['id']]
+
+
+def test_per_user_quota_evicts_oldest(monkeypatch):
+    monkeypatch.setattr(artifacts, "MAX_ARTIFACTS_PER_USER", 2)
+    for i in range(4):
+        save_artifact("alice", "code", f"f{i}.txt", f"c{i}")
+
+    assert [e['name'] for e in list_artifacts("alice")] == ["f3.txt", "f2.txt"]
+
+
+def test_oversized_content_is_rejected(store, monkeypatch):
+    monkeypatch.setattr(artifacts, "MAX_BYTES_PER_USER", 10)
+
+    with pytest.raises(ValueError, match="too large"):
+        save_artifact("alice", "code", "big.txt", "x" * 11)
+    drain()
+    assert list_artifacts("alice") == []
+    assert files_under(store) == []
+
+
+def test_deleting_last_artifact_removes_index_object_and_shard(store):
+    entry = save_artifact("alice", "code", "a.txt", "only one")
+    drain()
+    delete_artifact("alice", entry['id'])
+    drain()
+
+    assert files_under(store) == []
+    assert [d for d in dirs_under(store) if d.startswith("objects" + os.sep)] == []
+
+
+def test_user_cap_evicts_user_with_oldest_save(monkeypatch, clock):
+    monkeypatch.setattr(artifacts, "MAX_ARTIFACT_USERS", 2)
+    save_artifact("u1", "code", "a.txt", "u1 code")
+    save_artifact("u2", "code", "a.txt", "u2 code")
+    save_artifact("u1", "code", "b.txt", "u1 more code")
+    save_artifact("u3", "code", "a.txt", "u3 code")
+    drain()
+
+    assert list_artifacts("u2") == []
+    assert len(list_artifacts("u1")) == 2 and len(list_artifacts("u3")) == 1
+
+
+def test_sweep_leaves_unchanged_indexes_alone(store, monkeypatch, clock):
+    for user in ["old", "active"]:
+        save_artifact(user, "code", "a.txt", f"{user} code")
+    drain()
+    paths = {user: artifacts._index_path(artifacts._user_key(user)) for user in ["old", "active"]}
+    for stamp, user in enumerate(["old", "active"], start=1000):
+        os.utime(paths[user], (stamp, stamp))
+    monkeypatch.setattr(artifacts, "_indexes", OrderedDict())
+
+    artifacts._executor.submit(artifacts._sweep)
+    drain()
+    assert [os.path.getmtime(paths[user]) for user in ["old", "active"]] == [1000, 1001]
+
+    monkeypatch.setattr(artifacts, "MAX_ARTIFACT_USERS", 2)
+    save_artifact("new", "code", "a.txt", "new code")
+    drain()
+    assert list_artifacts("old") == [] and len(list_artifacts("active")) == 1
+
+
+def test_zip_bundle_contains_every_artifact():
+    save_artifact("alice", "code", "a.txt", "A")
+    save_artifact("alice", "interview_prep", "b.txt", "B")
+
+    with zipfile.ZipFile(zip_bundle("alice")) as zf:
+        contents = sorted(zf.read(name) for name in zf.namelist())
+    assert contents == [b"A", b"B"]
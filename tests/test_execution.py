@@ -0,0 +1,43 @@
+import asyncio
+import shutil
+
+import pytest
+
+from mentor_core import run_code
+
+
+def test_run_python():
+    result = asyncio.run(run_code("Python", "print('Hello, World!')"))
+
+    assert result['stdout'] == "Hello, World!\n"
+    assert result['returncode'] == 0
+
+
+def test_python_errors_come_back_on_stderr():
+    result = asyncio.run(run_code("Python", "raise SystemExit('boom')"))
+
+    assert "boom" in result['stderr']
+    assert result['returncode'] != 0
+
+
+def test_concurrent_runs_do_not_share_files():
+    async def run_many():
+        return await asyncio.gather(*[run_code("Python", f"print({i})") for i in range(5)])
+
+    assert [r['stdout'] for r in asyncio.run(run_many())] == [f"{i}\n" for i in range(5)]
+
+
+def test_timeout_kills_the_process():
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(run_code("Python", "import time\ntime.sleep(30)", timeout=0.5))
+
+
+@pytest.mark.skipif(shutil.which("g++") is None, reason="g++ not installed")
+def test_compile_failure_raises():
+    with pytest.raises(RuntimeError, match="Compilation failed"):
+        asyncio.run(run_code("C++", "int main( { return 0; }"))
+
+
+def test_unsupported_module_is_rejected():
+    with pytest.raises(ValueError):
+        asyncio.run(run_code("Go", "package main"))
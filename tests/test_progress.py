@@ -0,0 +1,49 @@
+from mentor_core import (
+    new_session_state, start_module, record_query, add_bookmark, remove_bookmark,
+    add_note, remove_note, progress_report
+)
+
+
+def test_record_query_tracks_progress_and_history():
+    state = new_session_state()
+    record_query(state, "Python", "What is a tuple?", "An immutable sequence.")
+    record_query(state, "Python", "And a list?", "A mutable one.")
+
+    assert state['total_queries'] == 2
+    assert state['user_progress']["Python"]['queries'] == 2
+    assert [entry['question'] for entry in state['chat_history']] == ["What is a tuple?", "And a list?"]
+
+
+def test_start_module_keeps_existing_progress():
+    state = new_session_state()
+    start_module(state, "SQL")['queries'] = 3
+
+    assert start_module(state, "SQL")['queries'] == 3
+
+
+def test_bookmarks_are_removed_by_id():
+    state = new_session_state()
+    first = add_bookmark(state, "Java", "q1", "a1")
+    second = add_bookmark(state, "Java", "q2", "a2")
+
+    assert remove_bookmark(state, first)['question'] == "q1"
+    assert list(state['bookmarks']) == [second]
+    assert remove_bookmark(state, first) is None
+
+
+def test_notes_default_to_general_and_are_removed_by_id():
+    state = new_session_state()
+    note_key = add_note(state, "Remember GIL")
+
+    assert state['user_notes'][note_key]['module'] == "General"
+    remove_note(state, note_key)
+    assert state['user_notes'] == {}
+
+
+def test_progress_report_lists_modules():
+    state = new_session_state()
+    record_query(state, "Docker", "q", "a")
+
+    report = progress_report(state)
+    assert "Total Queries: 1" in report
+    assert "- Docker: Started" in report